@@ -4,10 +4,25 @@ import json
 from typing import Generator, List, Dict
 
 import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
+try:
+    # Much faster per-delta parsing; raises a json.JSONDecodeError subclass
+    from orjson import loads as _json_loads  # type: ignore[import-not-found]
+except ImportError:
+    from json import loads as _json_loads
 
 from .auth import auth_manager
 from .models import AIModel, get_model, DEFAULT_MODEL
 
+# Shared across clients so follow-up requests reuse the keep-alive TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+_SESSION.headers["Content-Type"] = "application/json"
+
+# (connect, read) seconds; the read timeout bounds the gap between streamed chunks
+_REQUEST_TIMEOUT = (5, 120)
+
 
 class AIClient:
     """Client for interacting with an AI API like OpenRouter."""
@@ -39,36 +54,33 @@ class AIClient:
             "stream": True,
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        headers = {"Authorization": f"Bearer {self.api_key}"}
 
-        buffer = ""
-        with requests.post(
-            self.api_url, headers=headers, json=data, stream=True
+        with _SESSION.post(
+            self.api_url,
+            headers=headers,
+            json=data,
+            stream=True,
+            timeout=_REQUEST_TIMEOUT,
         ) as response:
             response.raise_for_status()
-            response.encoding = "utf-8"
 
-            for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
-                if not chunk:
+            # Raw byte lines: framing happens in iter_lines and both JSON
+            # parsers accept UTF-8 bytes, so nothing is decoded up front
+            for line in response.iter_lines(chunk_size=1024):
+                if not line.startswith(b"data: "):
+                    continue
+                data_content = line[6:]
+                if data_content == b"[DONE]":
+                    return
+                try:
+                    data_obj = _json_loads(data_content)
+                    content = (
+                        data_obj.get("choices", [{}])[0]
+                        .get("delta", {})
+                        .get("content")
+                    )
+                    if content:
+                        yield content
+                except (json.JSONDecodeError, IndexError):
                     continue
-                buffer += chunk
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    if line.startswith("data: "):
-                        data_content = line[6:]
-                        if data_content == "[DONE]":
-                            return
-                        try:
-                            data_obj = json.loads(data_content)
-                            content = (
-                                data_obj.get("choices", [{}])[0]
-                                .get("delta", {})
-                                .get("content")
-                            )
-                            if content:
-                                yield content
-                        except (json.JSONDecodeError, IndexError):
-                            continue
@@ -73,8 +73,8 @@ class StructuredBrowserAgent:
             system_prompt=self._system_prompt,
         )
 
-    def run(self, user_query: str) -> AIAction:
-        """Execute the agent and return a structured AIAction."""
+    def _compose_prompt(self, user_query: str) -> str:
+        """Prefix the user query with the conversation history, if any."""
         if not user_query or not user_query.strip():
             raise StructuredAIError("User query cannot be empty")
 
@@ -87,40 +87,61 @@ class StructuredBrowserAgent:
 
         history_block = "\n".join(history_lines)
         if history_block:
-            composed_prompt = (
-                f"Conversation so far:\n{history_block}\n\nUser: {user_query}"
-            )
-        else:
-            composed_prompt = user_query
-
-        try:
-            result = self._agent.run_sync(composed_prompt)
-        except Exception as exc:  # pragma: no cover - defensive fallback
-            message = str(exc)
-            if (
-                "not a valid model id" in message.lower()
-                and self._model_config.provider == "openrouter"
-            ):
-                fallback = self._get_fallback_model()
-                if fallback is not None:
-                    print(
-                        f"Requested OpenRouter model unavailable; "
-                        f"falling back to '{FALLBACK_MODEL}'."
-                    )
-                    self._model_name = FALLBACK_MODEL
-                    self._model_config = fallback
-                    self._init_agent()
-                    return self.run(user_query)
-            raise StructuredAIError(f"Structured agent failed: {message}") from exc
+            return f"Conversation so far:\n{history_block}\n\nUser: {user_query}"
+        return user_query
+
+    def _switch_to_fallback(self, exc: Exception) -> bool:
+        """Swap to the fallback model when OpenRouter rejects the model id."""
+        message = str(exc)
+        if (
+            "not a valid model id" in message.lower()
+            and self._model_config.provider == "openrouter"
+        ):
+            fallback = self._get_fallback_model()
+            if fallback is not None:
+                print(
+                    f"Requested OpenRouter model unavailable; "
+                    f"falling back to '{FALLBACK_MODEL}'."
+                )
+                self._model_name = FALLBACK_MODEL
+                self._model_config = fallback
+                self._init_agent()
+                return True
+        return False
+
+    @staticmethod
+    def _extract_action(result) -> AIAction:
         if result.output is None:
             raise StructuredAIError("Structured agent returned no output.")
-        
+
         # Validate the action before returning
         if not isinstance(result.output.action, (type(None).__class__,)):
             # The action is already validated by Pydantic, just return it
             return result.output.action
         raise StructuredAIError("Invalid action type returned from agent")
 
+    def run(self, user_query: str) -> AIAction:
+        """Execute the agent and return a structured AIAction."""
+        composed_prompt = self._compose_prompt(user_query)
+        try:
+            result = self._agent.run_sync(composed_prompt)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            if self._switch_to_fallback(exc):
+                return self.run(user_query)
+            raise StructuredAIError(f"Structured agent failed: {exc}") from exc
+        return self._extract_action(result)
+
+    async def run_async(self, user_query: str) -> AIAction:
+        """Async variant of run() for callers that own an event loop."""
+        composed_prompt = self._compose_prompt(user_query)
+        try:
+            result = await self._agent.run(composed_prompt)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            if self._switch_to_fallback(exc):
+                return await self.run_async(user_query)
+            raise StructuredAIError(f"Structured agent failed: {exc}") from exc
+        return self._extract_action(result)
+
     def _get_fallback_model(self) -> Optional[AIModel]:
         """Return a fallback model configuration when available."""
         if self._model_name == FALLBACK_MODEL:
@@ -1,17 +1,20 @@
 """Qt WebEngine implementation"""
 
+import logging
 from typing import Callable
 from .base import WebEngine
 
 try:
     from PySide6.QtWebEngineWidgets import QWebEngineView
     from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
-    from PySide6.QtCore import QUrl, QBuffer, QIODevice
+    from PySide6.QtCore import QUrl, QBuffer, QByteArray, QIODevice
     from PySide6.QtGui import QImage
     QT_AVAILABLE = True
 except ImportError:
     QT_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class QtWebEngine(WebEngine):
     """Qt WebEngine implementation"""
@@ -22,6 +25,8 @@ class QtWebEngine(WebEngine):
         
         self._widget = None
         self._dev_tools = None
+        # Scratch PNG buffer, reused across captures to keep its allocation
+        self._screenshot_data = QByteArray()
     
     def create_widget(self) -> QWebEngineView:
         """Create Qt web view widget"""
@@ -50,16 +55,17 @@ class QtWebEngine(WebEngine):
     def load_url(self, url: str):
         """Load a URL"""
         if self._widget:
-            print(f"Loading URL: {url[:100]}...")
+            logger.debug("Loading URL: %.100s...", url)
             
             # Handle data URLs differently
             if url.startswith('data:'):
                 qurl = QUrl(url)
-                print(f"Loading data URL, length: {len(url)}")
+                logger.debug("Loading data URL, length: %d", len(url))
             else:
-                if not url.startswith(('http://', 'https://')):
-                    url = 'https://' + url
-                qurl = QUrl(url)
+                qurl = QUrl.fromUserInput(url)
+                # fromUserInput guesses http for bare hosts; keep https as default
+                if qurl.scheme() == 'http' and not url.startswith('http://'):
+                    qurl.setScheme('https')
             
             self._widget.load(qurl)
     
@@ -169,16 +175,16 @@ class QtWebEngine(WebEngine):
             # Convert pixmap to QImage
             image = pixmap.toImage()
             
-            # Convert to PNG bytes
-            buffer = QBuffer()
+            # Encode PNG into the reused scratch array, then copy it out once
+            png_data = self._screenshot_data
+            png_data.truncate(0)  # keeps capacity, unlike clear()
+            buffer = QBuffer(png_data)
             buffer.open(QIODevice.OpenModeFlag.WriteOnly)
             image.save(buffer, "PNG")
-            
-            # Get the bytes
-            image_bytes = buffer.data().data()
             buffer.close()
+            image_bytes = bytes(png_data)
             
-            print(f"Screenshot captured: {len(image_bytes)} bytes")
+            logger.debug("Screenshot captured: %d bytes", len(image_bytes))
             callback(image_bytes)
         except Exception as e:
             print(f"Error capturing screenshot: {e}")
@@ -8,9 +8,16 @@ os.environ.setdefault("QT_API", "pyside6")
 
 # Native Wayland support
 os.environ.setdefault("QT_QPA_PLATFORM", "wayland")
+# Chromium reads these once, so they must be set before QApplication exists.
+# Software rendering is the safe default; MINIMAL_BROWSER_GPU=1 opts into GPU
+# rasterization on drivers known to work.
+_SOFTWARE_RENDER_FLAGS = "--no-sandbox --disable-dev-shm-usage --disable-gpu --disable-gpu-compositing --enable-software-rasterizer --disable-background-timer-throttling --disable-renderer-backgrounding --disable-backgrounding-occluded-windows"
+_GPU_RENDER_FLAGS = "--no-sandbox --disable-dev-shm-usage --enable-gpu-rasterization --ignore-gpu-blocklist --enable-zero-copy --disable-background-timer-throttling --disable-renderer-backgrounding --disable-backgrounding-occluded-windows"
 os.environ.setdefault(
     "QTWEBENGINE_CHROMIUM_FLAGS",
-    "--no-sandbox --disable-dev-shm-usage --disable-gpu --disable-gpu-compositing --enable-software-rasterizer --disable-background-timer-throttling --disable-renderer-backgrounding --disable-backgrounding-occluded-windows",
+    _GPU_RENDER_FLAGS
+    if os.environ.get("MINIMAL_BROWSER_GPU") == "1"
+    else _SOFTWARE_RENDER_FLAGS,
 )
 
 # Hyprland-specific fixes
@@ -4,33 +4,58 @@
 import os
 import sys
 import html
-import base64
+import functools
+import logging
+import time
+import traceback
+from enum import StrEnum
 from typing import MutableMapping, Optional, cast
 
-
-from PySide6.QtCore import QUrl, Qt, QTimer, QEvent
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib module
+    import pybase64 as base64  # type: ignore[import-not-found]
+except ImportError:
+    import base64
+
+
+from PySide6.QtCore import (
+    QUrl,
+    Qt,
+    QTimer,
+    QEvent,
+    QFile,
+    QIODevice,
+    QObject,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import QKeySequence, QShortcut, QKeyEvent
 from PySide6.QtWidgets import (
     QMainWindow,
     QVBoxLayout,
     QWidget,
     QLabel,
+    QLineEdit,
 )
+from PySide6.QtWebChannel import QWebChannel
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import (
     QWebEngineProfile,
+    QWebEngineScript,
     QWebEngineSettings,
     QWebEnginePage,
 )
 
 from .engines.qt_engine import QtWebEngine
-from .ai.schemas import AIAction, ConversationMemory
+from .ai.schemas import AIAction, ConversationMemory, HtmlAction
 from .ai.tools import ResponseProcessor
 from .rendering.artifacts import URLBuilder
 from .storage.conversations import ConversationLog
-from .ui.ai_worker import AIWorker
+from .ui.ai_worker import AIRequest, AIWorker
 from .ui.command_palette import CommandPalette
 
+logger = logging.getLogger(__name__)
+
 
 def to_data_url(html: str) -> str:
     """Encode HTML content into a data URL with base64 encoding"""
@@ -47,6 +72,95 @@ def to_data_url(html: str) -> str:
         return f"data:text/html;charset=utf-8;base64,{encoded_html}"
 
 
+_DATA_URL_PREFIX = "data:text/html;charset=utf-8;base64,"
+
+
+def _encode_page_head(head: str) -> str:
+    """Base64-encode a static page head for reuse as a data URL prefix.
+
+    The head is space-padded to a 3-byte boundary so the base64 of any
+    dynamic body can be appended to it without re-encoding the head.
+    """
+    head_bytes = head.encode("utf-8")
+    head_bytes += b" " * (-len(head_bytes) % 3)
+    return base64.b64encode(head_bytes).decode("ascii")
+
+
+def _data_url_with_head(head_b64: str, body: str) -> str:
+    """Build a data URL from a pre-encoded head and a dynamic body"""
+    # Page HTML from toHtml may carry lone surrogates; replace them like to_data_url
+    encoded_body = base64.b64encode(body.encode("utf-8", errors="replace")).decode(
+        "ascii"
+    )
+    return f"{_DATA_URL_PREFIX}{head_b64}{encoded_body}"
+
+
+_DEBUG_PAGE_HEAD_B64 = _encode_page_head(
+    """<!DOCTYPE html>
+<html>
+<head>
+    <title>Debug Info</title>
+    <style>
+        body { background: #202020; color: #f0f0f0; font-family: system-ui; padding: 24px; }
+        table { border-collapse: collapse; width: 100%; max-width: 700px; }
+        th, td { border: 1px solid #444; padding: 8px; text-align: left; }
+        th { background: #2f2f2f; color: #4a9eff; width: 180px; }
+    </style>
+</head>
+<body>
+    <h1>VimBrowser Debug Info</h1>
+    <table>
+"""
+)
+
+# Row labels for show_debug_info; literals without markup, so never escaped
+_DEBUG_LABELS = ("Current URL", "Mode", "Buffers", "AI Worker Running", "Engine")
+
+_SOURCE_PAGE_HEAD_B64 = _encode_page_head(
+    """<!DOCTYPE html>
+<html>
+<head>
+    <title>Page Source</title>
+    <style>
+        body { background: #1e1e1e; color: #dcdcdc; margin: 0; padding: 16px; font-family: monospace; }
+        pre { white-space: pre-wrap; word-wrap: break-word; }
+        h1 { color: #4a9eff; }
+    </style>
+</head>
+<body>
+"""
+)
+
+_SOURCE_PAGE_BODY = """
+    <h1>Page Source: {url}</h1>
+    <pre>{source}</pre>
+</body>
+</html>
+"""
+
+
+def _format_status_url(url: str) -> str:
+    """Shorten a buffer URL for display in the vim status bar"""
+    if url.startswith("data:"):
+        return "AI Generated Content"
+    if len(url) > 60:
+        return url[:57] + "..."
+    return url
+
+
+# Qt API probe done once; older QtWebEngine builds lack the dev tools hook
+_HAS_DEVTOOLS_PAGE = hasattr(QWebEnginePage, "setDevToolsPage")
+
+_PROFILE_NAME = "minimal-browser"
+_HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# ~30 Hz cap on loading-overlay repaints while a response streams in
+_OVERLAY_REFRESH_MS = 33
+
+# Identical notifications closer together than this only extend the one shown
+_NOTIFICATION_DEBOUNCE_S = 0.25
+
+
 OS_ENV: MutableMapping[str, str] = cast(MutableMapping[str, str], os.environ)  # type: ignore[attr-defined]
 
 
@@ -66,6 +180,138 @@ VIM_COMMANDS = {
     "bp": "Previous buffer",
 }
 
+class Mode(StrEnum):
+    """Vim-style input modes; members compare equal to their status bar text"""
+
+    NORMAL = "NORMAL"
+    COMMAND = "COMMAND"
+    INSERT = "INSERT"
+    AI_CHAT = "AI_CHAT"
+
+
+# Status bar text per mode; StrEnum members hash like their plain-string values
+_MODE_LABELS: dict[str, str] = {
+    mode: mode.value if mode is Mode.NORMAL else f"-- {mode.value} --" for mode in Mode
+}
+
+# Command palette prefixes -> (VimBrowser method, characters to strip);
+# one- and two-character prefixes never collide, so lookup tries [:1] then [:2]
+_COMMAND_HANDLERS: dict[str, tuple[str, int]] = {
+    ":": ("execute_vim_command", 1),
+    "/": ("search_page", 1),
+    "o ": ("open_url", 2),
+    "s ": ("smart_search", 2),
+    "a ": ("ai_search", 2),
+    "🤖": ("ai_chat", 2),  # prompt is "🤖 "
+}
+
+# Exact-match vim commands mapped to VimBrowser method names (None is a no-op)
+_VIM_COMMAND_HANDLERS: dict[str, Optional[str]] = {
+    "q": "close",
+    "quit": "close",
+    "wq": "close",
+    "w": None,
+    "write": None,
+    "help": "show_help",
+    "h": "show_help",
+}
+
+# Buffer commands dispatch on their first two characters (":bnext" -> "bn")
+_VIM_BUFFER_HANDLERS: dict[str, str] = {
+    "b": "show_buffers",
+    "bd": "close_buffer",
+    "bn": "next_buffer",
+    "bp": "prev_buffer",
+}
+
+
+# Window shortcuts as (key, VimBrowser method name)
+# Note: "?" is handled in keyPressEvent instead of QShortcut, which avoids
+# Wayland compatibility issues with QKeySequence("?"); Space likewise
+_SHORTCUTS: tuple[tuple[str, str], ...] = (
+    # Escape key - always goes to normal mode
+    ("Escape", "normal_mode"),
+    # Normal mode shortcuts
+    (":", "command_mode"),
+    ("/", "search_mode"),
+    ("s", "smart_search_mode"),  # Smart search
+    ("a", "ai_search_mode"),  # AI/LLM search
+    ("F1", "show_help"),  # Help
+    ("F10", "toggle_dev_tools"),  # Developer Tools
+    ("Ctrl+U", "view_source"),  # View Source
+    ("Ctrl+I", "show_debug_info"),  # Debug Info
+    ("r", "reload_page"),
+    ("H", "go_back"),
+    ("L", "go_forward"),
+    ("n", "next_buffer"),
+    ("p", "prev_buffer"),
+    ("o", "open_prompt"),
+    ("t", "new_buffer"),
+    ("x", "close_buffer"),
+    ("q", "quit_if_normal"),
+    ("Ctrl+T", "new_buffer"),
+    ("Ctrl+W", "close_buffer"),
+    ("Ctrl+R", "reload_page"),
+    ("Ctrl+Tab", "next_buffer"),
+)
+
+
+# Keys the NORMAL-mode shortcuts (and scroll bindings) consume; keyPressEvent
+# leaves these alone instead of forwarding them to the base class
+_NORMAL_SHORTCUT_KEYS = frozenset(
+    {":", "/", "s", "a", "r", "h", "l", "n", "p", "o", "t", "x", "q", "j", "k", "d", "u", "g"}
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _key_sequence(key: str) -> QKeySequence:
+    """Parse a shortcut string once and reuse the QKeySequence"""
+    return QKeySequence(key)
+
+
+# Native smooth scrolling; the compositor animates it without per-frame JS
+_SCROLL_JS = "window.scrollBy({{top: {0}, behavior: 'smooth'}});"
+
+
+# Isolated JS world for the insert-mode script and its channel, so page
+# scripts can neither see the bridge nor force the browser's mode
+_INSERT_MODE_WORLD_ID = QWebEngineScript.ScriptWorldId.ApplicationWorld.value
+
+# Injected once per document; reports focus changes on editable elements
+_INSERT_MODE_JS = """
+(function() {
+    if (typeof QWebChannel === 'undefined' || !window.qt || !qt.webChannelTransport) {
+        return;
+    }
+    new QWebChannel(qt.webChannelTransport, function(channel) {
+        const bridge = channel.objects.insertMode;
+        const editable = 'input, textarea, [contenteditable="true"]';
+
+        // Delegated capturing listeners cover inputs added after load
+        document.addEventListener('focusin', function(event) {
+            if (event.target.matches && event.target.matches(editable)) {
+                bridge.set_insert_mode(true);
+            }
+        }, true);
+        document.addEventListener('focusout', function(event) {
+            if (event.target.matches && event.target.matches(editable)) {
+                bridge.set_insert_mode(false);
+            }
+        }, true);
+    });
+})();
+"""
+
+
+class _InsertModeBridge(QObject):
+    """QWebChannel endpoint that pages call when input focus changes"""
+
+    focus_changed = Signal(bool)
+
+    @Slot(bool)
+    def set_insert_mode(self, is_insert: bool) -> None:
+        self.focus_changed.emit(is_insert)
+
 
 class VimBrowser(QMainWindow):
     def __init__(self, conversation_log: ConversationLog, headless: bool = False):
@@ -76,11 +322,15 @@ class VimBrowser(QMainWindow):
         OS_ENV.setdefault("WAYLAND_DISPLAY", OS_ENV.get("WAYLAND_DISPLAY", "wayland-0"))
         OS_ENV.setdefault("qt-scale-factor", "1")
         OS_ENV.setdefault("WLR_NO_HARDWARE_CURSORS", "1")
-        self.mode = "NORMAL"
+        self.mode: Mode = Mode.NORMAL
         self.command_buffer = ""
         self.active_command_prefix: Optional[str] = None
         self.buffers: list[str] = []
+        # URL -> position in self.buffers; buffer URLs are unique
+        self._buffer_index: dict[str, int] = {}
         self.current_buffer = 0
+        # Parsed QUrl per buffer, kept in lockstep with self.buffers (None until parsed)
+        self._buffer_qurls: list[Optional[QUrl]] = []
         self.ai_worker: Optional[AIWorker] = None
         self.last_query: Optional[str] = None
         self.current_ai_mode: str = "chat"
@@ -89,9 +339,17 @@ class VimBrowser(QMainWindow):
         self.conv_memory: ConversationMemory = ConversationMemory()
         self.engine = QtWebEngine() if not headless else None
         self._dev_tools_window: Optional[QWebEngineView] = None
+        self.command_palette: Optional[CommandPalette] = None
+        self.command_line: Optional[QLineEdit] = None
+        self.vim_status: Optional[QLabel] = None
         self.initial_load = True
         self._pending_url_timer: Optional[QTimer] = None
         self._url_load_sequence = 0
+        self._last_status_key: Optional[tuple[int, int, str, Optional[str]]] = None
+        self._current_url_str = ""
+        self._status_url_source: Optional[str] = None
+        self._status_url = ""
+        self._last_notification: tuple[str, float] = ("", 0.0)
         self._init_ai_overlay()
         self._init_profile_and_browser()
         self._init_status_bar()
@@ -133,19 +391,29 @@ class VimBrowser(QMainWindow):
         self.loading_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.loading_overlay.hide()
         self.loading_overlay.raise_()
+        # Stream chunks are collected here and joined/painted once per interval
+        self._ai_stream_parts: list[str] = []
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setInterval(_OVERLAY_REFRESH_MS)
+        self._overlay_timer.timeout.connect(self._flush_overlay_text)
 
     def _init_profile_and_browser(self):
-        self.profile = QWebEngineProfile()
+        # A named profile is disk-backed; the default one is off-the-record and
+        # silently ignores the persistent cookie, storage and cache settings
+        self.profile = QWebEngineProfile(_PROFILE_NAME)
         self.profile.setPersistentCookiesPolicy(
             QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
         )
         self.profile.setPersistentStoragePath(
             os.path.join(os.path.expanduser("~"), ".minimal-browser")
         )
+        self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        self.profile.setHttpCacheMaximumSize(_HTTP_CACHE_MAX_BYTES)
         try:
             self.browser = QWebEngineView()
             self.page = QWebEnginePage(self.profile, self)
             self.browser.setPage(self.page)
+            self._install_insert_mode_bridge()
             settings = self.browser.settings()
             settings.setAttribute(
                 QWebEngineSettings.WebAttribute.JavascriptEnabled, True
@@ -205,6 +473,7 @@ class VimBrowser(QMainWindow):
 
     def _init_command_line(self):
         self.command_palette = CommandPalette(self)
+        self.command_palette.set_command_registry(VIM_COMMANDS)
         self.command_line = self.command_palette.input
         self.command_palette.hide()
         self.command_line.returnPressed.connect(self.execute_command)
@@ -214,7 +483,7 @@ class VimBrowser(QMainWindow):
         self.command_line.installEventFilter(self)
 
     def _position_command_palette(self) -> None:
-        if not hasattr(self, "command_palette"):
+        if self.command_palette is None:
             return
         width = min(480, self.width() - 60)
         width = max(width, 300)
@@ -236,79 +505,73 @@ class VimBrowser(QMainWindow):
         self.mode_timer = QTimer()
         self.mode_timer.timeout.connect(self.hide_mode_indicator)
         self.mode_timer.setSingleShot(True)
+        # Restarted by each notification, so a newer message is never hidden early
+        self._notif_timer = QTimer(self)
+        self._notif_timer.setSingleShot(True)
+        self._notif_timer.timeout.connect(self._hide_notification)
 
     def _connect_browser_signals(self):
-        self.browser.loadStarted.connect(lambda: print("Page load started"))
-        self.browser.loadProgress.connect(lambda p: print(f"Load progress: {p}%"))
+        self.browser.loadStarted.connect(self._on_load_started)
+        self.browser.loadProgress.connect(
+            lambda p: logger.debug("Load progress: %d%%", p)
+        )
         self.browser.loadFinished.connect(
-            lambda ok: print(f"Page load finished: {'SUCCESS' if ok else 'FAILED'}")
+            lambda ok: logger.debug(
+                "Page load finished: %s", "SUCCESS" if ok else "FAILED"
+            )
         )
-        self.browser.loadFinished.connect(self._setup_insert_mode_detection)
-
-    def _setup_insert_mode_detection(self):
-        """Set up JavaScript to detect when input fields are focused"""
-        js_code = """
-        (function() {
-            function updateMode(isInsert) {
-                window.vimBrowserInsertMode = isInsert;
-            }
+        self.browser.urlChanged.connect(self._on_url_changed)
+
+    def _install_insert_mode_bridge(self) -> None:
+        """Expose the insert-mode bridge to pages through a QWebChannel"""
+        self._insert_mode_bridge = _InsertModeBridge(self)
+        self._insert_mode_bridge.focus_changed.connect(self._on_insert_focus_changed)
+        self._web_channel = QWebChannel(self.page)
+        self._web_channel.registerObject("insertMode", self._insert_mode_bridge)
+        self.page.setWebChannel(self._web_channel, _INSERT_MODE_WORLD_ID)
+
+        channel_js = QFile(":/qtwebchannel/qwebchannel.js")
+        if not channel_js.open(QIODevice.OpenModeFlag.ReadOnly):
+            logger.warning("qwebchannel.js unavailable; insert mode detection disabled")
+            return
+        source = bytes(channel_js.readAll().data()).decode("utf-8")
+        channel_js.close()
+
+        script = QWebEngineScript()
+        script.setName("minimal-browser-insert-mode")
+        script.setSourceCode(source + _INSERT_MODE_JS)
+        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+        script.setWorldId(_INSERT_MODE_WORLD_ID)
+        # Editors embedded in iframes should switch modes too
+        script.setRunsOnSubFrames(True)
+        self.profile.scripts().insert(script)
+
+    def _on_insert_focus_changed(self, is_insert: bool) -> None:
+        """Switch between NORMAL and INSERT when an editable element gains or loses focus"""
+        if is_insert and self.mode == Mode.NORMAL:
+            self.mode = Mode.INSERT
+            self.update_title()
+        elif not is_insert:
+            self._leave_insert_mode()
 
-            function addListeners() {
-                const inputs = document.querySelectorAll('input, textarea, [contenteditable="true"]');
-                inputs.forEach(function(element) {
-                    element.addEventListener('focus', function() {
-                        updateMode(true);
-                    });
-                    element.addEventListener('blur', function() {
-                        updateMode(false);
-                    });
-                });
-            }
+    def _leave_insert_mode(self) -> None:
+        """Drop back to NORMAL when the focused editable may vanish without a focusout"""
+        if self.mode == Mode.INSERT:
+            self.mode = Mode.NORMAL
+            self.update_title()
 
-            // Run immediately and also when DOM changes
-            addListeners();
-
-            // Use MutationObserver to detect new inputs added dynamically
-            const observer = new MutationObserver(function(mutations) {
-                mutations.forEach(function(mutation) {
-                    if (mutation.type === 'childList') {
-                        addListeners();
-                    }
-                });
-            });
-
-            observer.observe(document.body, {
-                childList: true,
-                subtree: true
-            });
-        })();
-        """
-        self.browser.page().runJavaScript(js_code)
-
-        # Set up timer to check insert mode status
-        self.insert_mode_timer = QTimer()
-        self.insert_mode_timer.timeout.connect(self._check_insert_mode)
-        self.insert_mode_timer.start(200)  # Check every 200ms
-
-    def _check_insert_mode(self):
-        """Check if we're in insert mode by querying JavaScript"""
-
-        def handle_result(result):
-            if result and self.mode == "NORMAL":
-                self.mode = "INSERT"
-                self.update_title()
-            elif not result and self.mode == "INSERT":
-                self.mode = "NORMAL"
-                self.update_title()
-
-        self.browser.page().runJavaScript(
-            "window.vimBrowserInsertMode || false", handle_result
-        )
+    def _on_load_started(self) -> None:
+        logger.debug("Page load started")
+        # Form submits, reloads and buffer switches unload the focused input
+        self._leave_insert_mode()
+
+    def _on_url_changed(self, qurl: QUrl) -> None:
+        self._current_url_str = qurl.toString()
+        # Same-document navigations often re-render and drop the focused node
+        self._leave_insert_mode()
 
     def _current_url(self) -> str:
-        if hasattr(self, "browser") and self.browser:
-            return self.browser.url().toString()
-        return ""
+        return self._current_url_str
 
     def _start_ai_request(self, query: str, mode: str) -> None:
         query = query.strip()
@@ -316,28 +579,37 @@ class VimBrowser(QMainWindow):
             self._show_notification("AI request requires content", timeout=2500)
             return
 
-        if self.ai_worker and self.ai_worker.isRunning():
+        if self.ai_worker and self.ai_worker.is_busy():
             self._show_notification("AI is already processing a request", timeout=2500)
             return
 
-        current_url = self._current_url()
-        history = self.conv_memory.as_history()
-        worker = AIWorker(query, current_url=current_url, history=history)
-        worker.response_ready.connect(self._on_ai_response_ready)
-        worker.progress_update.connect(self._on_ai_progress_update)
-        worker.streaming_chunk.connect(self._on_ai_stream_chunk)
-
-        self.ai_worker = worker
+        worker = self._get_ai_worker()
+        request = AIRequest(
+            query=query,
+            current_url=self._current_url(),
+            history=self.conv_memory.as_history(),
+        )
         self.last_query = query
         self.current_ai_mode = mode
         self.ai_stream_buffer = ""
+        self._ai_stream_parts.clear()
 
         self.conv_memory.add_user(query)
         self.loading_overlay.setText("🤖 Analyzing request...")
         self.loading_overlay.show()
         self.loading_overlay.raise_()
 
-        worker.start()
+        worker.submit(request)
+
+    def _get_ai_worker(self) -> AIWorker:
+        """Return the shared AI worker, creating and wiring it on first use"""
+        if self.ai_worker is None:
+            worker = AIWorker()
+            worker.response_ready.connect(self._on_ai_response_ready)
+            worker.progress_update.connect(self._on_ai_progress_update)
+            worker.streaming_chunk.connect(self._on_ai_stream_chunk)
+            self.ai_worker = worker
+        return self.ai_worker
 
     def _on_ai_progress_update(self, message: str) -> None:
         if not message:
@@ -347,18 +619,32 @@ class VimBrowser(QMainWindow):
     def _on_ai_stream_chunk(self, chunk: str) -> None:
         if not chunk:
             return
-        self.ai_stream_buffer += chunk
+        self._ai_stream_parts.append(chunk)
+        if not self._overlay_timer.isActive():
+            self._overlay_timer.start()
+
+    def _flush_overlay_text(self) -> None:
+        parts = self._ai_stream_parts
+        if not parts:
+            # Nothing arrived since the last paint; idle until the next chunk
+            self._overlay_timer.stop()
+            return
+        # One join per refresh instead of a str += per chunk
+        self.ai_stream_buffer += "".join(parts)
+        parts.clear()
         preview = self.ai_stream_buffer.strip()
         if preview:
             self.loading_overlay.setText(preview[-160:])
 
     def _on_ai_response_ready(self, status: str, payload: str) -> None:
+        # Cleared here, on the GUI thread, so a new submit cannot overtake this slot
+        if self.ai_worker is not None:
+            self.ai_worker.mark_idle()
+        self._overlay_timer.stop()
+        self._ai_stream_parts.clear()
         self.loading_overlay.hide()
         self.loading_overlay.clear()
 
-        if self.ai_worker:
-            self.ai_worker.deleteLater()
-        self.ai_worker = None
         self.ai_stream_buffer = ""
 
         if status != "success":
@@ -381,7 +667,11 @@ class VimBrowser(QMainWindow):
 
     def _apply_ai_action(self, action: AIAction) -> None:
         destination = URLBuilder.resolve_action(action)
-        self.open_url(destination)
+        if isinstance(action, HtmlAction):
+            # The data URL only keys the buffer; load the HTML we already have
+            self.open_url(destination, html_content=action.html)
+        else:
+            self.open_url(destination)
 
     def _handle_ai_error(self, message: str) -> None:
         print(f"AI error: {message}")
@@ -391,43 +681,34 @@ class VimBrowser(QMainWindow):
     def _show_notification(self, message: str, timeout: int = 3000) -> None:
         if not message:
             return
+        now = time.monotonic()
+        last_message, last_shown = self._last_notification
+        self._last_notification = (message, now)
+        if (
+            message == last_message
+            and now - last_shown < _NOTIFICATION_DEBOUNCE_S
+            and self._notif_timer.isActive()
+        ):
+            # Repeat of the message on screen: just extend its lifetime
+            self._notif_timer.start(timeout)
+            return
         status_bar = self.statusBar()
         status_bar.show()
-        status_bar.showMessage(message, timeout)
-        QTimer.singleShot(timeout, status_bar.hide)
+        # No Qt-side timeout: _notif_timer owns the lifetime so repeats can extend it
+        status_bar.showMessage(message)
+        self._notif_timer.start(timeout)
+
+    def _hide_notification(self) -> None:
+        status_bar = self.statusBar()
+        status_bar.clearMessage()
+        status_bar.hide()
 
     def setup_keybindings(self):
-        # Escape key - always goes to normal mode
-        QShortcut(QKeySequence("Escape"), self, self.normal_mode)
-
-        # Normal mode shortcuts
-        QShortcut(QKeySequence(":"), self, self.command_mode)
-        QShortcut(QKeySequence("/"), self, self.search_mode)
-        QShortcut(QKeySequence("s"), self, self.smart_search_mode)  # Smart search
-        QShortcut(QKeySequence("a"), self, self.ai_search_mode)  # AI/LLM search
-        QShortcut(QKeySequence("F1"), self, self.show_help)  # Help
-        # Note: "?" keybinding handled in keyPressEvent instead of QShortcut
-        # This avoids Wayland compatibility issues with QKeySequence("?")
-        QShortcut(QKeySequence("F10"), self, self.toggle_dev_tools)  # Developer Tools
-        QShortcut(QKeySequence("Ctrl+U"), self, self.view_source)  # View Source
-        QShortcut(QKeySequence("Ctrl+I"), self, self.show_debug_info)  # Debug Info
-        QShortcut(QKeySequence("r"), self, self.reload_page)
-        QShortcut(QKeySequence("H"), self, self.go_back)
-        QShortcut(QKeySequence("L"), self, self.go_forward)
-        QShortcut(QKeySequence("n"), self, self.next_buffer)
-        QShortcut(QKeySequence("p"), self, self.prev_buffer)
-        QShortcut(QKeySequence("o"), self, self.open_prompt)
-        # Note: Space key handled directly in keyPressEvent - more reliable in Wayland than QShortcut
-        QShortcut(QKeySequence("t"), self, self.new_buffer)
-        QShortcut(QKeySequence("x"), self, self.close_buffer)
-        QShortcut(QKeySequence("q"), self, self.quit_if_normal)
-        QShortcut(QKeySequence("Ctrl+T"), self, self.new_buffer)
-        QShortcut(QKeySequence("Ctrl+W"), self, self.close_buffer)
-        QShortcut(QKeySequence("Ctrl+R"), self, self.reload_page)
-        QShortcut(QKeySequence("Ctrl+Tab"), self, self.next_buffer)
+        for key, handler_name in _SHORTCUTS:
+            QShortcut(_key_sequence(key), self, getattr(self, handler_name))
 
     def keyPressEvent(self, event):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             key = event.text()
             # Handle "?" key directly in keyPressEvent - more reliable in Wayland than QShortcut
             if key == "?":
@@ -439,27 +720,7 @@ class VimBrowser(QMainWindow):
                 event.accept()  # Accept the event to prevent further processing
                 self.ai_chat_mode()
                 return
-            key_lower = key.lower()
-            if key_lower in [
-                ":",
-                "/",
-                "s",
-                "a",
-                "r",
-                "h",
-                "l",
-                "n",
-                "p",
-                "o",
-                "t",
-                "x",
-                "q",
-                "j",
-                "k",
-                "d",
-                "u",
-                "g",
-            ]:
+            if key.lower() in _NORMAL_SHORTCUT_KEYS:
                 # Let shortcuts handle these
                 pass
             else:
@@ -469,42 +730,46 @@ class VimBrowser(QMainWindow):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if hasattr(self, "command_palette"):
+        if self.command_palette is not None:
             self._position_command_palette()
-        if hasattr(self, "loading_overlay"):
-            self.loading_overlay.resize(self.size())
+        # The overlay is the first widget built in __init__, before any resize
+        self.loading_overlay.resize(self.size())
+
+    def closeEvent(self, event):
+        if self.ai_worker is not None:
+            self.ai_worker.stop()
+        super().closeEvent(event)
 
     def normal_mode(self):
-        self.mode = "NORMAL"
-        if hasattr(self, "command_palette"):
+        self.mode = Mode.NORMAL
+        if self.command_palette is not None:
             self.command_palette.hide()
             # Hide suggestion list when palette is hidden
-            if hasattr(self.command_palette, "suggestion_list"):
-                self.command_palette.suggestion_list.hide()
-        if hasattr(self, "command_line"):
+            self.command_palette.suggestion_list.hide()
+        if self.command_line is not None:
             self.command_line.clear()
         self.active_command_prefix = None
         self.update_title()
         self.setFocus()
 
     def command_mode(self):
-        if self.mode == "NORMAL":
-            self.mode = "COMMAND"
+        if self.mode == Mode.NORMAL:
+            self.mode = Mode.COMMAND
             self.show_command_line(":")
 
     def search_mode(self):
-        if self.mode == "NORMAL":
-            self.mode = "COMMAND"
+        if self.mode == Mode.NORMAL:
+            self.mode = Mode.COMMAND
             self.show_command_line("/")
 
     def open_prompt(self):
-        if self.mode == "NORMAL":
-            self.mode = "COMMAND"
+        if self.mode == Mode.NORMAL:
+            self.mode = Mode.COMMAND
             self.show_command_line("o ")
 
     def smart_search_mode(self):
-        if self.mode == "NORMAL":
-            self.mode = "COMMAND"
+        if self.mode == Mode.NORMAL:
+            self.mode = Mode.COMMAND
             self.show_command_line("s ")
 
     def smart_search(self, query: str) -> None:
@@ -520,21 +785,21 @@ class VimBrowser(QMainWindow):
         self._start_ai_request(query, mode="search")
 
     def ai_search_mode(self):
-        if self.mode == "NORMAL":
-            self.mode = "COMMAND"
+        if self.mode == Mode.NORMAL:
+            self.mode = Mode.COMMAND
             self.show_command_line("a ")
 
     def ai_chat(self, query: str) -> None:
+        logger.debug("Executing AI chat with query: %r", query)
         self._start_ai_request(query, mode="chat")
 
     def ai_chat_mode(self):
-        if self.mode == "NORMAL":
-            self.mode = "AI_CHAT"
+        if self.mode == Mode.NORMAL:
+            self.mode = Mode.AI_CHAT
             self.show_command_line("🤖 ")
 
     def _safe_show_help(self):
         """Wrapper for show_help that catches all exceptions to prevent crashes"""
-        import traceback
         try:
             self.show_help()
         except Exception as e:
@@ -544,26 +809,22 @@ class VimBrowser(QMainWindow):
             self._show_notification("Help screen unavailable", timeout=2000)
 
     def show_help(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             try:
-                help_content = self.get_help_content()
-                # Use the existing to_data_url helper which handles encoding properly
-                help_url = to_data_url(help_content)
-                self.open_url(help_url)
+                self.open_url(_HELP_DATA_URL)
             except Exception as e:
-                import traceback
                 print(f"Error in show_help: {e}")
                 traceback.print_exc()
                 # Don't re-raise to prevent UI crash
 
     def show_command_line(self, prefix: str) -> None:
         self.active_command_prefix = prefix
-        if hasattr(self, "command_palette"):
+        if self.command_palette is not None:
             self.command_palette.configure(prefix)
             self.command_palette.show()
             self.command_palette.raise_()
             self._position_command_palette()
-        if hasattr(self, "command_line"):
+        if self.command_line is not None:
             self.command_line.setFocus()
             # Update suggestions if in command mode with colon prefix
             if prefix == ":":
@@ -572,7 +833,7 @@ class VimBrowser(QMainWindow):
 
     def _on_command_text_changed(self, text: str) -> None:
         """Handle text changes in command line for autocomplete"""
-        if self.active_command_prefix == ":" and hasattr(self, "command_palette"):
+        if self.active_command_prefix == ":" and self.command_palette is not None:
             self.command_palette.update_suggestions(text, VIM_COMMANDS)
 
     def eventFilter(self, obj, event) -> bool:
@@ -582,7 +843,7 @@ class VimBrowser(QMainWindow):
             key = key_event.key()
             
             # Only handle navigation when in command mode with colon prefix
-            if self.active_command_prefix == ":" and hasattr(self, "command_palette"):
+            if self.active_command_prefix == ":" and self.command_palette is not None:
                 if key == Qt.Key.Key_Up:
                     self.command_palette.navigate_suggestions(-1)
                     return True
@@ -605,7 +866,7 @@ class VimBrowser(QMainWindow):
         
         # Check for selected autocomplete suggestion when in command mode
         # If user navigated to a suggestion with arrow keys, use that instead of typed text
-        if prefix == ":" and hasattr(self, "command_palette"):
+        if prefix == ":" and self.command_palette is not None:
             selected_cmd = self.command_palette.get_selected_command()
             if selected_cmd and self.command_palette.suggestion_list.isVisible():
                 # Use the selected suggestion instead of the typed text
@@ -624,90 +885,81 @@ class VimBrowser(QMainWindow):
             self.normal_mode()
             return
 
-        if command.startswith(":"):
-            self.execute_vim_command(command[1:])
-        elif command.startswith("/"):
-            self.search_page(command[1:])
-        elif command.startswith("o "):
-            self.open_url(command[2:])
-        elif command.startswith("s "):
-            self.smart_search(command[2:])
-        elif command.startswith("a "):
-            self.ai_search(command[2:])
-        elif command.startswith("🤖"):
-            query = command[2:]
-            print(f"Executing AI chat with query: '{query}'")
-            self.ai_chat(query)
+        handler = _COMMAND_HANDLERS.get(command[:1]) or _COMMAND_HANDLERS.get(
+            command[:2]
+        )
+        if handler is not None:
+            handler_name, skip = handler
+            getattr(self, handler_name)(command[skip:])
 
         self.normal_mode()
 
     def execute_vim_command(self, cmd):
         cmd = cmd.strip()
 
-        if cmd in ["q", "quit"]:
-            self.close()
-        elif cmd in ["w", "write"]:
-            pass
-        elif cmd in ["wq"]:
-            self.close()
-        elif cmd in ["help", "h"]:
-            self.show_help()
-        elif cmd.startswith("e "):
-            url = cmd[2:]
-            self.open_url(url)
+        if cmd in _VIM_COMMAND_HANDLERS:
+            handler_name = _VIM_COMMAND_HANDLERS[cmd]
+            if handler_name is not None:
+                getattr(self, handler_name)()
+            return
+
+        head, sep, rest = cmd.partition(" ")
+        if head == "e" and sep:
+            self.open_url(rest)
         elif cmd.startswith("b"):
-            if cmd == "b":
-                self.show_buffers()
-            elif cmd.startswith("bd"):
-                self.close_buffer()
-            elif cmd.startswith("bn"):
-                self.next_buffer()
-            elif cmd.startswith("bp"):
-                self.prev_buffer()
+            handler_name = _VIM_BUFFER_HANDLERS.get(cmd[:2])
+            if handler_name is not None:
+                getattr(self, handler_name)()
         elif cmd.isdigit():
             buf_num = int(cmd) - 1
             if 0 <= buf_num < len(self.buffers):
-                self.current_buffer = buf_num
-                self.browser.load(QUrl(self.buffers[self.current_buffer]))
-                self.update_title()
+                self._load_buffer(buf_num)
 
     def toggle_dev_tools(self):
-        if not hasattr(self, "browser") or self.browser is None:
+        if self.browser is None:
             self._show_notification(
                 "Developer tools are unavailable in headless mode", timeout=3000
             )
             return
 
         page = self.browser.page()
-        if not hasattr(page, "setDevToolsPage"):
+        if not _HAS_DEVTOOLS_PAGE:
             print("Developer tools not available in this Qt version")
             self._show_notification(
                 "Developer tools not available in this Qt version", timeout=3500
             )
             return
 
+        if self._dev_tools_window is not None and self._dev_tools_window.isVisible():
+            # Detach and drop the view so its renderer process is released while hidden
+            page.setDevToolsPage(None)
+            self._dev_tools_window.hide()
+            self._dev_tools_window.deleteLater()
+            self._dev_tools_window = None
+            return
+
         if self._dev_tools_window is None:
             self._dev_tools_window = QWebEngineView()
             self._dev_tools_window.setWindowTitle("Developer Tools")
             self._dev_tools_window.resize(900, 600)
             page.setDevToolsPage(self._dev_tools_window.page())
 
-        if self._dev_tools_window.isVisible():
-            self._dev_tools_window.hide()
-        else:
-            self._dev_tools_window.show()
-            self._dev_tools_window.raise_()
-            self._dev_tools_window.activateWindow()
+        self._dev_tools_window.show()
+        self._dev_tools_window.raise_()
+        self._dev_tools_window.activateWindow()
 
     def search_page(self, query):
         if query:
             self.browser.findText(query)
 
-    def open_url(self, url):
-        print(f"Opening URL: {url[:100]}...")  # Debug logging
+    def open_url(self, url, html_content: Optional[str] = None):
+        logger.debug("Opening URL: %.100s", url)
 
         # Handle data URLs differently - extract HTML for setHtml() which is more Wayland-compatible
-        if url.startswith("data:"):
+        if html_content is not None:
+            # Caller supplied the page for this data URL; nothing to decode
+            qurl = None
+        elif url.startswith("data:"):
             # Extract HTML from data URL for setHtml() - more reliable in Wayland
             try:
                 # Parse data:text/html;base64,<data>
@@ -725,17 +977,22 @@ class VimBrowser(QMainWindow):
                 qurl = QUrl(url)
                 html_content = None
         else:
-            if not url.startswith(("http://", "https://")):
-                url = "https://" + url
-            qurl = QUrl(url)
+            # Qt handles scheme guessing, local paths and IDN hosts natively
+            qurl = QUrl.fromUserInput(url)
+            # fromUserInput guesses http for bare hosts; keep https as default
+            if qurl.scheme() == "http" and not url.startswith("http://"):
+                qurl.setScheme("https")
+            url = qurl.toString()
             html_content = None
 
         # Add to buffers if not already there
-        if url not in self.buffers:
+        index = self._buffer_index.get(url)
+        if index is None:
+            index = self._buffer_index[url] = len(self.buffers)
             self.buffers.append(url)
-            self.current_buffer = len(self.buffers) - 1
-        else:
-            self.current_buffer = self.buffers.index(url)
+            # Keep the QUrl parsed above; inline HTML buffers parse on first switch
+            self._buffer_qurls.append(qurl if html_content is None else None)
+        self.current_buffer = index
         
         # Wayland fix: Ensure window is shown and activated before loading
         if not self.isVisible():
@@ -790,84 +1047,72 @@ class VimBrowser(QMainWindow):
         self.update_title()
 
     def reload_page(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.browser.reload()
 
     def go_back(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.browser.back()
 
     def go_forward(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.browser.forward()
 
     def new_buffer(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.open_prompt()
 
+    def _load_buffer(self, index: int) -> None:
+        """Switch to the buffer at index and load it, reusing parsed QUrls"""
+        qurl = self._buffer_qurls[index]
+        if qurl is None:
+            qurl = self._buffer_qurls[index] = QUrl(self.buffers[index])
+        self.current_buffer = index
+        self.setWindowTitle("Switching...")
+        self.browser.load(qurl)
+        self.update_title()
+
     def close_buffer(self):
         if len(self.buffers) > 1:
-            del self.buffers[self.current_buffer]
-            if self.current_buffer >= len(self.buffers):
-                self.current_buffer = len(self.buffers) - 1
-            self.browser.load(QUrl(self.buffers[self.current_buffer]))
+            closed = self.buffers.pop(self.current_buffer)
+            del self._buffer_qurls[self.current_buffer]
+            del self._buffer_index[closed]
+            # Only buffers after the closed one shift down
+            for index in range(self.current_buffer, len(self.buffers)):
+                self._buffer_index[self.buffers[index]] = index
+            self._load_buffer(min(self.current_buffer, len(self.buffers) - 1))
         else:
             self.close()
-        self.update_title()
+            self.update_title()
 
     def next_buffer(self):
-        if self.mode == "NORMAL" and len(self.buffers) > 1:
-            self.current_buffer = (self.current_buffer + 1) % len(self.buffers)
-            self.setWindowTitle("Switching...")
-            self.browser.load(QUrl(self.buffers[self.current_buffer]))
-            self.update_title()
+        if self.mode == Mode.NORMAL and len(self.buffers) > 1:
+            self._load_buffer((self.current_buffer + 1) % len(self.buffers))
 
     def prev_buffer(self):
-        if self.mode == "NORMAL" and len(self.buffers) > 1:
-            self.current_buffer = (self.current_buffer - 1) % len(self.buffers)
-            self.setWindowTitle("Switching...")
-            self.browser.load(QUrl(self.buffers[self.current_buffer]))
-            self.update_title()
+        if self.mode == Mode.NORMAL and len(self.buffers) > 1:
+            self._load_buffer((self.current_buffer - 1) % len(self.buffers))
 
     def scroll_page(self, pixels):
-        if self.mode == "NORMAL":
-            direction = 1 if pixels > 0 else -1
-            distance = abs(pixels)
-            js = f"""
-            function smoothScroll() {{
-                let start = window.pageYOffset;
-                let current = start;
-                let step = {direction} * Math.min(20, {distance});
-                function animate() {{
-                    current += step;
-                    window.scrollTo(0, current);
-                    let remaining = Math.abs({distance} - Math.abs(current - start));
-                    if (remaining > 0) {{
-                        requestAnimationFrame(animate);
-                    }}
-                }}
-                animate();
-            }}
-            smoothScroll();
-            """
-            self.browser.page().runJavaScript(js)
+        if self.mode == Mode.NORMAL:
+            self.browser.page().runJavaScript(_SCROLL_JS.format(int(pixels)))
 
     def scroll_top(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.browser.page().runJavaScript("window.scrollTo(0, 0);")
 
     def scroll_bottom(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.browser.page().runJavaScript(
                 "window.scrollTo(0, document.body.scrollHeight);"
             )
 
     def quit_if_normal(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.close()
 
     def view_source(self):
-        if not hasattr(self, "browser") or self.browser is None:
+        if self.browser is None:
             self._show_notification("Browser instance unavailable", timeout=2500)
             return
 
@@ -875,68 +1120,36 @@ class VimBrowser(QMainWindow):
             if not content:
                 self._show_notification("Unable to retrieve page source", timeout=3000)
                 return
-            escaped = html.escape(content)
-            source_html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Page Source</title>
-                <style>
-                    body {{ background: #1e1e1e; color: #dcdcdc; margin: 0; padding: 16px; font-family: monospace; }}
-                    pre {{ white-space: pre-wrap; word-wrap: break-word; }}
-                    h1 {{ color: #4a9eff; }}
-                </style>
-            </head>
-            <body>
-                <h1>Page Source: {html.escape(self._current_url() or "unknown")}</h1>
-                <pre>{escaped}</pre>
-            </body>
-            </html>
-            """
-            self.open_url(to_data_url(source_html))
+            source_body = _SOURCE_PAGE_BODY.format(
+                url=html.escape(self._current_url() or "unknown"),
+                source=html.escape(content),
+            )
+            self.open_url(_data_url_with_head(_SOURCE_PAGE_HEAD_B64, source_body))
 
         self.browser.page().toHtml(handle_html)
 
     def show_debug_info(self):
-        debug_rows = [
-            ("Current URL", self._current_url() or "unknown"),
-            ("Mode", self.mode),
-            ("Buffers", ", ".join(self.buffers) if self.buffers else "none"),
-            (
-                "AI Worker Running",
-                "yes" if self.ai_worker and self.ai_worker.isRunning() else "no",
-            ),
-            ("Engine", self.engine.engine_name if self.engine else "None (headless)"),
-        ]
+        debug_values = (
+            self._current_url() or "unknown",
+            self.mode,
+            ", ".join(self.buffers) if self.buffers else "none",
+            "yes" if self.ai_worker and self.ai_worker.is_busy() else "no",
+            self.engine.engine_name if self.engine else "None (headless)",
+        )
         rows_html = "".join(
-            f"<tr><th>{html.escape(label)}</th><td>{html.escape(value)}</td></tr>"
-            for label, value in debug_rows
+            f"<tr><th>{label}</th><td>{html.escape(value)}</td></tr>"
+            for label, value in zip(_DEBUG_LABELS, debug_values)
         )
-        debug_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Debug Info</title>
-            <style>
-                body {{ background: #202020; color: #f0f0f0; font-family: system-ui; padding: 24px; }}
-                table {{ border-collapse: collapse; width: 100%; max-width: 700px; }}
-                th, td {{ border: 1px solid #444; padding: 8px; text-align: left; }}
-                th {{ background: #2f2f2f; color: #4a9eff; width: 180px; }}
-            </style>
-        </head>
-        <body>
-            <h1>VimBrowser Debug Info</h1>
-            <table>
-                {rows_html}
-            </table>
-        </body>
-        </html>
-        """
-        self.open_url(to_data_url(debug_html))
+        debug_body = f"""{rows_html}
+    </table>
+</body>
+</html>
+"""
+        self.open_url(_data_url_with_head(_DEBUG_PAGE_HEAD_B64, debug_body))
 
     def show_buffers(self):
         if self.buffers:
-            buf_info = f"Buffers: {', '.join(f'{i + 1}:{url.split("/")[-1][:20]}' for i, url in enumerate(self.buffers))}"
+            buf_info = f"Buffers: {', '.join(f'{i + 1}:{url.rpartition("/")[2][:20]}' for i, url in enumerate(self.buffers))}"
             self.setWindowTitle(buf_info)
             self.mode_timer.start(3000)
 
@@ -944,31 +1157,45 @@ class VimBrowser(QMainWindow):
         self.setWindowTitle("Minimal Browser")
 
         # Update vim status bar
-        if hasattr(self, "vim_status"):
-            current_url = ""
-            if self.buffers and self.current_buffer < len(self.buffers):
-                current_url = self.buffers[self.current_buffer]
-                if current_url.startswith("data:"):
-                    current_url = "AI Generated Content"
-                elif len(current_url) > 60:
-                    current_url = current_url[:57] + "..."
-
-            buffer_info = (
-                f"[{self.current_buffer + 1}/{len(self.buffers)}]"
-                if self.buffers
-                else "[0/0]"
-            )
-            mode_text = f"-- {self.mode} --" if self.mode != "NORMAL" else "NORMAL"
+        vim_status = self.vim_status
+        if vim_status is None:
+            return
 
-            status_text = f"{buffer_info} {current_url} | {mode_text}"
-            self.vim_status.setText(status_text)
+        # Read once: called on every mode change and buffer switch
+        buffers = self.buffers
+        current = self.current_buffer
+        count = len(buffers)
+        mode = self.mode
+        source_url = buffers[current] if count and current < count else None
+        # Skip all formatting when nothing the status line shows has changed
+        status_key = (current, count, mode, source_url)
+        if status_key == self._last_status_key:
+            return
+        self._last_status_key = status_key
+
+        current_url = ""
+        if source_url is not None:
+            # Only re-shorten when the current buffer URL actually changed
+            if source_url != self._status_url_source:
+                self._status_url_source = source_url
+                self._status_url = _format_status_url(source_url)
+            current_url = self._status_url
+
+        buffer_info = f"[{current + 1}/{count}]" if count else "[0/0]"
+        mode_text = _MODE_LABELS.get(mode) or f"-- {mode} --"
+
+        vim_status.setText(f"{buffer_info} {current_url} | {mode_text}")
 
     def hide_mode_indicator(self):
-        if self.mode == "NORMAL":
+        if self.mode == Mode.NORMAL:
             self.update_title()
 
     def get_help_content(self):
-        return """<!DOCTYPE html>
+        return _HELP_HTML
+
+
+# Static help page; encoded once at import since it never changes
+_HELP_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>Vim Browser Help</title>
@@ -1187,4 +1414,6 @@ class VimBrowser(QMainWindow):
     
     <p style="margin-top: 40px; color: #666;"><span class="key">Press Escape</span> to return to normal browsing</p>
 </body>
-</html>"""
\ No newline at end of file
+</html>"""
+
+_HELP_DATA_URL = to_data_url(_HELP_HTML)
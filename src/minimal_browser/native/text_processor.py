@@ -10,6 +10,16 @@ from __future__ import annotations
 import re
 from typing import Optional, Tuple
 
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib module
+    import pybase64 as base64  # type: ignore[import-not-found]
+except ImportError:
+    import base64
+
+# Markdown emphasis; bold must be applied before italic
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.*?)\*")
+
 
 class TextProcessor:
     """Text processing with optional native acceleration."""
@@ -136,9 +146,7 @@ class TextProcessor:
                 # Fall back to Python on any error
                 pass
 
-        # Pure Python fallback
-        import base64
-
+        # Python fallback (pybase64 when installed)
         return base64.b64encode(data).decode("ascii")
 
     @staticmethod
@@ -162,6 +170,6 @@ class TextProcessor:
                 pass
 
         # Pure Python fallback
-        result = re.sub(r"\*\*(.*?)\*\*", r"<strong>\1</strong>", text)
-        result = re.sub(r"\*(.*?)\*", r"<em>\1</em>", result)
+        result = _BOLD_RE.sub(r"<strong>\1</strong>", text)
+        result = _ITALIC_RE.sub(r"<em>\1</em>", result)
         return result
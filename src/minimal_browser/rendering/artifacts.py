@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from urllib.parse import quote
 
 from ..ai.schemas import (
@@ -16,6 +17,12 @@ from .html import create_data_url
 from .webapps import render_webapp
 
 
+@functools.lru_cache(maxsize=32)
+def _webapp_data_url(widget_type: str, theme: str, title: str | None) -> str:
+    """Render and encode a widget page; the output depends only on the arguments."""
+    return create_data_url(render_webapp(widget_type, theme=theme, title=title))
+
+
 class URLBuilder:
     """Convert AI actions into browser destinations."""
 
@@ -36,10 +43,9 @@ class URLBuilder:
         if isinstance(action, HtmlAction):
             return create_data_url(action.html)
         if isinstance(action, WebappAction):
-            html = render_webapp(
-                action.widget_type, theme=action.theme or "dark", title=action.title
+            return _webapp_data_url(
+                action.widget_type, action.theme or "dark", action.title
             )
-            return create_data_url(html)
         if isinstance(action, BookmarkAction):
             return str(action.url)
         raise TypeError(f"Unsupported action type: {type(action)!r}")
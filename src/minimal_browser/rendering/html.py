@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import base64
 import os
 import re
 from pathlib import Path
@@ -10,6 +9,12 @@ from typing import Any, Dict
 
 from jinja2 import Environment, FileSystemLoader, Template
 
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib module
+    import pybase64 as base64  # type: ignore[import-not-found]
+except ImportError:
+    import base64
+
 # Optional: Import optimized text processor for performance
 try:
     from ..native import TextProcessor
@@ -18,6 +23,10 @@ try:
 except ImportError:
     _USE_NATIVE_OPTIMIZATION = False
 
+# Markdown emphasis for the fallback path; bold must be applied before italic
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.*?)\*")
+
 
 def _discover_template_dir() -> Path:
     """Return the first available templates directory."""
@@ -67,8 +76,8 @@ def wrap_content_as_html(content: str, query: str) -> str:
         processed = TextProcessor.markdown_to_html(content)
     else:
         # Fallback to standard regex
-        processed = re.sub(r"\*\*(.*?)\*\*", r"<strong>\1</strong>", content)
-        processed = re.sub(r"\*(.*?)\*", r"<em>\1</em>", processed)
+        processed = _BOLD_RE.sub(r"<strong>\1</strong>", content)
+        processed = _ITALIC_RE.sub(r"<em>\1</em>", processed)
 
     processed = processed.replace("\n\n", "</p><p>")
     processed = processed.replace("\n", "<br>")
@@ -11,6 +11,7 @@ applications and widgets within the browser. It includes:
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -118,8 +119,12 @@ class WidgetRegistry:
         return list(cls._widgets.keys())
 
 
+@functools.lru_cache(maxsize=None)
 def _get_base_styles(theme: WidgetTheme) -> str:
     """Get base CSS styles for widgets.
+
+    The result only depends on the theme, so each theme's stylesheet is
+    built once and shared by every widget render.
     
     Args:
         theme: The theme to use
@@ -1,6 +1,6 @@
 """UI components for Minimal Browser"""
 
 from .command_palette import CommandPalette
-from .ai_worker import AIWorker
+from .ai_worker import AIRequest, AIWorker
 
-__all__ = ["CommandPalette", "AIWorker"]
+__all__ = ["CommandPalette", "AIRequest", "AIWorker"]
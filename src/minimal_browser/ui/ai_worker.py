@@ -1,57 +1,163 @@
 """AI worker thread for non-blocking API calls"""
 
+import asyncio
+import logging
+import queue
+from dataclasses import dataclass, field
 from typing import Optional
 
-import requests  # type: ignore[import-untyped]
 from PySide6.QtCore import QThread, Signal as pyqtSignal
 
 from ..ai.prompts import get_browser_assistant_prompt
-from ..ai.structured import StructuredBrowserAgent, StructuredAIError
 from ..ai.tools import ResponseProcessor
 
+logger = logging.getLogger(__name__)
+
+
+# Wire prefixes understood by ResponseProcessor.parse_response
+_RESPONSE_PREFIXES = {
+    "navigate": "NAVIGATE:",
+    "search": "SEARCH:",
+    "html": "HTML:",
+}
+
+# Progress summary labels for the known action types
+_SUMMARY_LABELS = {
+    "navigate": "NAVIGATE: ",
+    "search": "SEARCH: ",
+    "html": "HTML: ",
+    "bookmark": "BOOKMARK: ",
+    "webapp": "WEBAPP: ",
+}
+
+
+@dataclass
+class AIRequest:
+    """A single query submitted to the AI worker"""
+
+    query: str
+    current_url: str = ""
+    history: list[dict[str, str]] = field(default_factory=list)
+
 
 class AIWorker(QThread):
-    """Worker thread for AI API calls with streaming support"""
+    """Long-lived worker thread serving queued AI requests with streaming support"""
 
     response_ready = pyqtSignal(str, str)  # response_type, content
     progress_update = pyqtSignal(str)  # progress message
     streaming_chunk = pyqtSignal(str)  # streaming response chunk
 
-    def __init__(
-        self,
-        query: str,
-        current_url: str = "",
-        history: Optional[list[dict[str, str]]] = None,
-    ):
+    def __init__(self):
         super().__init__()
-        self.query = query
-        self.current_url = current_url
-        self.history = list(history or [])
+        self._requests: "queue.Queue[Optional[AIRequest]]" = queue.Queue()
+        self._busy = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.query = ""
+        self.current_url = ""
+        self.history: list[dict[str, str]] = []
+
+    def submit(self, request: AIRequest) -> None:
+        """Queue a request, starting the thread on first use"""
+        self._busy = True
+        self._requests.put(request)
+        if not self.isRunning():
+            self.start()
+
+    def is_busy(self) -> bool:
+        """Whether a submitted request has not been handled by the GUI yet"""
+        return self._busy
+
+    def mark_idle(self) -> None:
+        """Called from the response_ready slot once the response has been handled"""
+        self._busy = False
+
+    def stop(self) -> None:
+        """Drop queued requests, cancel the one in flight and wait for the thread"""
+        if not self.isRunning():
+            return
+        while True:
+            try:
+                self._requests.get_nowait()
+            except queue.Empty:
+                break
+        self._stopping = True
+        self._requests.put(None)
+        loop = self._loop
+        if loop is not None:
+            try:
+                # Looks the task up when it runs on the loop, so a request that
+                # is still importing or building its agent is cancelled too
+                loop.call_soon_threadsafe(self._cancel_task)
+            except RuntimeError:
+                pass  # loop already closed; the thread is exiting anyway
+        self.wait()
+
+    def _cancel_task(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
 
     def run(self):
+        # One loop for the thread's lifetime keeps the agent's HTTP connections warm
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            while True:
+                request = self._requests.get()
+                if request is None:
+                    return
+                self.query = request.query
+                self.current_url = request.current_url
+                self.history = list(request.history)
+                self._handle_request()
+        finally:
+            self._loop = None
+            loop.close()
+
+    def _handle_request(self) -> None:
         try:
-            print(f"AI Worker starting for query: {self.query}")
+            logger.debug("AI Worker starting for query: %r", self.query)
             self.progress_update.emit("Analyzing request...")
 
             response = self.get_ai_response(self.query, self.current_url)
-            print(f"AI Worker got response: {response[:100]}...")
+            logger.debug("AI Worker got response: %.100s...", response)
 
+            # _busy stays set until the GUI slot calls mark_idle()
             self.response_ready.emit("success", response)
+        except asyncio.CancelledError:
+            logger.debug("AI Worker request cancelled")
         except Exception as e:
-            print(f"AI Worker error: {e}")
+            logger.warning("AI Worker error: %s", e)
             self.response_ready.emit("error", str(e))
 
     def get_ai_response(self, query: str, current_url: str) -> str:
         """Get a structured AI response using pydantic-ai."""
+        # Deferred so pydantic-ai and requests load on the first AI request, not at startup
+        import requests  # type: ignore[import-untyped]
+
+        from ..ai.structured import StructuredBrowserAgent, StructuredAIError
+
         system_prompt = get_browser_assistant_prompt(current_url)
         agent = StructuredBrowserAgent(
             system_prompt=system_prompt,
             history=self.history,
         )
 
+        if self._stopping:
+            raise asyncio.CancelledError
+
         self.progress_update.emit("Requesting structured action…")
+        loop = self._loop
+        assert loop is not None, "get_ai_response only runs inside run()"
         try:
-            action = agent.run(query)
+            # Kept on self so stop() can cancel it from the GUI thread
+            self._task = loop.create_task(agent.run_async(query))
+            try:
+                action = loop.run_until_complete(self._task)
+            finally:
+                self._task = None
         except StructuredAIError as exc:
             raise Exception(str(exc)) from exc
         except requests.exceptions.RequestException as exc:
@@ -61,14 +167,8 @@ class AIWorker(QThread):
 
         action_type, payload = ResponseProcessor.action_to_tuple(action)
 
-        prefix_map = {
-            "navigate": "NAVIGATE:",
-            "search": "SEARCH:",
-            "html": "HTML:",
-        }
-        prefix = prefix_map.get(action_type, "HTML:")
-
-        summary = f"{action.type.upper()}: {payload[:160]}"
-        self.streaming_chunk.emit(summary)
+        prefix = _RESPONSE_PREFIXES.get(action_type, "HTML:")
+        label = _SUMMARY_LABELS.get(action.type) or action.type.upper() + ": "
+        self.streaming_chunk.emit(label + payload[:160])
 
-        return f"{prefix}{payload}"
+        return prefix + payload
@@ -1,5 +1,6 @@
 """Command palette widget for vim-like commands"""
 
+from bisect import bisect_left
 from typing import Optional
 
 from PySide6.QtCore import Qt, QTimer
@@ -19,6 +20,89 @@ from ..config.default_config import DEFAULT_CONFIG
 
 COMMAND_PROMPT_STYLES = DEFAULT_CONFIG.ui.command_prompt_styles
 
+# Fallback for unknown prefixes and for keys missing from user-configured styles
+_DEFAULT_STYLE: dict[str, str] = {
+    "icon": "⌨️",
+    "label": "Command Mode",
+    "placeholder": "Type a command",
+    "bg_color": "rgba(20, 20, 20, 220)",
+    "border_color": "rgba(255, 255, 255, 0.12)",
+}
+
+# Every entry carries the full key set, so lookups can index directly
+_PROMPT_STYLES: dict[str, dict[str, str]] = {
+    prefix: {**_DEFAULT_STYLE, **style}
+    for prefix, style in COMMAND_PROMPT_STYLES.items()
+}
+
+
+def _build_stylesheet(bg_color: str, border_color: str) -> str:
+    """Return the palette stylesheet for the given prompt colors"""
+    return f"""
+    #CommandPalette {{
+        background-color: {bg_color};
+        border-radius: 12px;
+        border: 1px solid {border_color};
+    }}
+    #CommandLabel {{
+        color: rgba(255, 255, 255, 0.8);
+        font-size: 12px;
+        font-weight: 600;
+        letter-spacing: 1.1px;
+        text-transform: uppercase;
+        white-space: nowrap;
+    }}
+    #CommandIcon {{
+        font-size: 18px;
+    }}
+    #CommandInput {{
+        background-color: rgba(255, 255, 255, 0.07);
+        border: 1px solid rgba(255, 255, 255, 0.12);
+        border-radius: 10px;
+        color: #ffffff;
+        font-size: 14px;
+        padding: 10px 14px;
+        selection-background-color: rgba(118, 75, 162, 0.6);
+    }}
+    #CommandInput:focus {{
+        border: 1px solid rgba(134, 84, 204, 0.8);
+        background-color: rgba(255, 255, 255, 0.12);
+    }}
+    #SuggestionList {{
+        background-color: {bg_color};
+        border-radius: 12px;
+        border: 1px solid {border_color};
+        color: #ffffff;
+        font-size: 13px;
+        padding: 8px;
+        outline: none;
+        max-height: 200px;
+    }}
+    #SuggestionList::item {{
+        padding: 8px 12px;
+        border-radius: 6px;
+        background-color: transparent;
+        margin: 2px 0;
+    }}
+    #SuggestionList::item:selected {{
+        background-color: rgba(134, 84, 204, 0.5);
+        color: #ffffff;
+    }}
+    #SuggestionList::item:hover {{
+        background-color: rgba(134, 84, 204, 0.3);
+    }}
+    """
+
+
+# Built once at import so configure() only does a dict lookup per prompt
+_DEFAULT_STYLESHEET = _build_stylesheet(
+    _DEFAULT_STYLE["bg_color"], _DEFAULT_STYLE["border_color"]
+)
+_STYLESHEET_CACHE: dict[str, str] = {
+    prefix: _build_stylesheet(style["bg_color"], style["border_color"])
+    for prefix, style in _PROMPT_STYLES.items()
+}
+
 
 class CommandPalette(QWidget):
     """Lightweight command palette widget with icon + input + autocomplete"""
@@ -31,6 +115,9 @@ class CommandPalette(QWidget):
         self.current_prefix: Optional[str] = None
         self.selected_index = -1
         self.command_registry: dict[str, str] = {}
+        # Registry sorted by lowercased name, built by set_command_registry
+        self._command_keys: list[str] = []
+        self._command_items: list[tuple[str, str]] = []
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 16, 20, 16)
@@ -70,62 +157,7 @@ class CommandPalette(QWidget):
         layout.addWidget(self.input)
         layout.addWidget(self.suggestion_list)
 
-        self.setStyleSheet(
-            """
-            #CommandPalette {
-                background-color: rgba(20, 20, 20, 220);
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.12);
-            }
-            #CommandLabel {
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 12px;
-                font-weight: 600;
-                letter-spacing: 1.1px;
-                text-transform: uppercase;
-                white-space: nowrap;
-            }
-            #CommandIcon {
-                font-size: 18px;
-            }
-            #CommandInput {
-                background-color: rgba(255, 255, 255, 0.07);
-                border: 1px solid rgba(255, 255, 255, 0.12);
-                border-radius: 10px;
-                color: #ffffff;
-                font-size: 14px;
-                padding: 10px 14px;
-                selection-background-color: rgba(118, 75, 162, 0.6);
-            }
-            #CommandInput:focus {
-                border: 1px solid rgba(134, 84, 204, 0.8);
-                background-color: rgba(255, 255, 255, 0.12);
-            }
-            #SuggestionList {
-                background-color: rgba(20, 20, 20, 220);
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.12);
-                color: #ffffff;
-                font-size: 13px;
-                padding: 8px;
-                outline: none;
-                max-height: 200px;
-            }
-            #SuggestionList::item {
-                padding: 8px 12px;
-                border-radius: 6px;
-                background-color: transparent;
-                margin: 2px 0;
-            }
-            #SuggestionList::item:selected {
-                background-color: rgba(134, 84, 204, 0.5);
-                color: #ffffff;
-            }
-            #SuggestionList::item:hover {
-                background-color: rgba(134, 84, 204, 0.3);
-            }
-            """
-        )
+        self.setStyleSheet(_DEFAULT_STYLESHEET)
 
         self.setFocusProxy(self.input)
 
@@ -140,89 +172,33 @@ class CommandPalette(QWidget):
         return hint
 
     def configure(self, prefix: str) -> None:
-        style = COMMAND_PROMPT_STYLES.get(prefix)
-        if style is None:
-            style = {
-                "icon": "⌨️",
-                "label": "Command Mode",
-                "placeholder": "Type a command",
-                "bg_color": "rgba(20, 20, 20, 220)",
-                "border_color": "rgba(255, 255, 255, 0.12)",
-            }
-        self.icon_label.setText(style["icon"])
-        self.mode_label.setText(style["label"])
-        self.input.setPlaceholderText(style["placeholder"])
         self.input.clear()
-        self.current_prefix = prefix
         self.selected_index = -1
         self.suggestion_list.clear()
         self.suggestion_list.hide()
-        
-        # Update dynamic colors
-        bg_color = style.get("bg_color", "rgba(20, 20, 20, 220)")
-        border_color = style.get("border_color", "rgba(255, 255, 255, 0.12)")
-        
-        self.setStyleSheet(
-            f"""
-            #CommandPalette {{
-                background-color: {bg_color};
-                border-radius: 12px;
-                border: 1px solid {border_color};
-            }}
-            #CommandLabel {{
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 12px;
-                font-weight: 600;
-                letter-spacing: 1.1px;
-                text-transform: uppercase;
-                white-space: nowrap;
-            }}
-            #CommandIcon {{
-                font-size: 18px;
-            }}
-            #CommandInput {{
-                background-color: rgba(255, 255, 255, 0.07);
-                border: 1px solid rgba(255, 255, 255, 0.12);
-                border-radius: 10px;
-                color: #ffffff;
-                font-size: 14px;
-                padding: 10px 14px;
-                selection-background-color: rgba(118, 75, 162, 0.6);
-            }}
-            #CommandInput:focus {{
-                border: 1px solid rgba(134, 84, 204, 0.8);
-                background-color: rgba(255, 255, 255, 0.12);
-            }}
-            #SuggestionList {{
-                background-color: {bg_color};
-                border-radius: 12px;
-                border: 1px solid {border_color};
-                color: #ffffff;
-                font-size: 13px;
-                padding: 8px;
-                outline: none;
-                max-height: 200px;
-            }}
-            #SuggestionList::item {{
-                padding: 8px 12px;
-                border-radius: 6px;
-                background-color: transparent;
-                margin: 2px 0;
-            }}
-            #SuggestionList::item:selected {{
-                background-color: rgba(134, 84, 204, 0.5);
-                color: #ffffff;
-            }}
-            #SuggestionList::item:hover {{
-                background-color: rgba(134, 84, 204, 0.3);
-            }}
-            """
-        )
+        if prefix == self.current_prefix:
+            # Same prompt reopened: labels and stylesheet are already applied
+            return
+
+        style = _PROMPT_STYLES.get(prefix, _DEFAULT_STYLE)
+        self.icon_label.setText(style["icon"])
+        self.mode_label.setText(style["label"])
+        self.input.setPlaceholderText(style["placeholder"])
+        self.current_prefix = prefix
+
+        # Stylesheets are prebuilt per prefix; only the lookup happens here
+        self.setStyleSheet(_STYLESHEET_CACHE.get(prefix, _DEFAULT_STYLESHEET))
 
     def set_command_registry(self, commands: dict[str, str]) -> None:
-        """Set the command registry for autocomplete"""
-        self.command_registry = commands
+        """Set the command registry for autocomplete
 
+        The names are sorted once here so prefix lookups can bisect; call
+        this again after changing the registry.
+        """
+        self.command_registry = commands
+        entries = sorted((cmd.lower(), cmd, desc) for cmd, desc in commands.items())
+        self._command_keys = [key for key, _, _ in entries]
+        self._command_items = [(cmd, desc) for _, cmd, desc in entries]
 
     def update_suggestions(self, text: str, commands: dict[str, str]) -> None:
         """Update suggestion list based on input text"""
@@ -240,14 +216,19 @@ class CommandPalette(QWidget):
         self.suggestion_list.clear()
         self.selected_index = -1
 
+        if commands is not self.command_registry:
+            self.set_command_registry(commands)
         if not text:
             # Show all commands when input is empty
-            matches = list(commands.items())
+            matches = list(self._command_items)
         else:
-            # Filter commands that start with the typed text
-            matches = [
-                (cmd, desc) for cmd, desc in commands.items() if cmd.lower().startswith(text)
-            ]
+            # Prefix matches are contiguous in the sorted keys
+            keys = self._command_keys
+            start = bisect_left(keys, text)
+            end = start
+            while end < len(keys) and keys[end].startswith(text):
+                end += 1
+            matches = self._command_items[start:end]
 
         if not matches:
             self.suggestion_list.hide()
@@ -259,9 +240,7 @@ class CommandPalette(QWidget):
                 QTimer.singleShot(10, parent._position_command_palette)
             return
 
-        # Sort matches by command name
-        matches.sort(key=lambda x: x[0])
-
+        # Matches come out of the index already sorted by command name
         # Add matches to suggestion list
         for cmd, desc in matches:
             item = QListWidgetItem(f"{cmd:<12} {desc}")
@@ -142,3 +142,12 @@ class TestWrapContentAsHtml:
         query = ""
         result = wrap_content_as_html(content, query)
         assert "Test content" in result
+
+    def test_wrap_content_escapes_query(self):
+        """Test the echoed query is escaped while content stays HTML."""
+        content = "<p>Answer</p>"
+        query = '<script>alert("x")</script> & more'
+        result = wrap_content_as_html(content, query)
+        assert "<script>" not in result
+        assert "&lt;script&gt;alert(&#34;x&#34;)&lt;/script&gt; &amp; more" in result
+        assert "<p>Answer</p>" in result